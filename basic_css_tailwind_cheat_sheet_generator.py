@@ -4,23 +4,205 @@ Basic CSS vs Tailwind CSS Cheat Sheet PDF Generator
 Creates a colorful, well-formatted PDF covering fundamental CSS properties with Tailwind equivalents
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+# reportlab is imported lazily inside the functions that need it, so importing
+# this module (e.g. from a batch driver) stays cheap and a missing install is
+# reported by main() instead of failing at import time
+import io
 import os
-from datetime import datetime
+from itertools import chain
+from cheat_sheet_common import cached_paragraph
+
+# Basic layout properties
+LAYOUT_PROPERTIES = (
+    ("display: block", "block", "Element takes full width, starts new line"),
+    ("display: inline", "inline", "Element only takes necessary width"),
+    ("display: inline-block", "inline-block", "Inline element with block properties"),
+    ("display: none", "hidden", "Element is completely hidden"),
+    ("display: flex", "flex", "Creates a flex container"),
+    ("display: grid", "grid", "Creates a grid container"),
+    ("position: static", "static", "Default positioning"),
+    ("position: relative", "relative", "Positioned relative to normal position"),
+    ("position: absolute", "absolute", "Positioned relative to nearest positioned parent"),
+    ("position: fixed", "fixed", "Positioned relative to viewport"),
+    ("position: sticky", "sticky", "Switches between relative and fixed"),
+    ("float: left", "float-left", "Element floats to the left"),
+    ("float: right", "float-right", "Element floats to the right"),
+    ("clear: both", "clear-both", "Clears floated elements on both sides"),
+)
+
+# Margin and padding properties
+SPACING_PROPERTIES = (
+    ("margin: 0", "m-0", "No margin on all sides"),
+    ("margin: 1rem", "m-4", "1rem margin on all sides"),
+    ("margin-top: 0.5rem", "mt-2", "0.5rem margin on top"),
+    ("margin-bottom: 1rem", "mb-4", "1rem margin on bottom"),
+    ("margin-left: 2rem", "ml-8", "2rem margin on left"),
+    ("margin-right: 2rem", "mr-8", "2rem margin on right"),
+    ("margin: 0 auto", "mx-auto", "Horizontal centering"),
+    ("padding: 0", "p-0", "No padding on all sides"),
+    ("padding: 1rem", "p-4", "1rem padding on all sides"),
+    ("padding-top: 0.5rem", "pt-2", "0.5rem padding on top"),
+    ("padding-bottom: 1rem", "pb-4", "1rem padding on bottom"),
+    ("padding-left: 2rem", "pl-8", "2rem padding on left"),
+    ("padding-right: 2rem", "pr-8", "2rem padding on right"),
+    ("padding: 1rem 2rem", "px-8 py-4", "Horizontal and vertical padding"),
+)
+
+# Width and height properties
+SIZING_PROPERTIES = (
+    ("width: 100%", "w-full", "Full width"),
+    ("width: 50%", "w-1/2", "Half width"),
+    ("width: 25%", "w-1/4", "Quarter width"),
+    ("width: auto", "w-auto", "Auto width"),
+    ("width: 100px", "w-24", "Fixed width (100px ≈ 6rem)"),
+    ("max-width: 100%", "max-w-full", "Maximum width 100%"),
+    ("min-width: 0", "min-w-0", "Minimum width 0"),
+    ("height: 100%", "h-full", "Full height"),
+    ("height: 100vh", "h-screen", "Full viewport height"),
+    ("height: 50%", "h-1/2", "Half height"),
+    ("height: auto", "h-auto", "Auto height"),
+    ("max-height: 100vh", "max-h-screen", "Maximum height of viewport"),
+    ("min-height: 100vh", "min-h-screen", "Minimum height of viewport"),
+)
+
+# Text and typography properties
+TEXT_PROPERTIES = (
+    ("color: black", "text-black", "Black text color"),
+    ("color: white", "text-white", "White text color"),
+    ("color: red", "text-red-500", "Red text color"),
+    ("font-size: 12px", "text-xs", "Extra small font size"),
+    ("font-size: 14px", "text-sm", "Small font size"),
+    ("font-size: 16px", "text-base", "Base font size (default)"),
+    ("font-size: 18px", "text-lg", "Large font size"),
+    ("font-size: 24px", "text-2xl", "Extra large font size"),
+    ("font-weight: normal", "font-normal", "Normal font weight"),
+    ("font-weight: bold", "font-bold", "Bold font weight"),
+    ("text-align: left", "text-left", "Left align text"),
+    ("text-align: center", "text-center", "Center align text"),
+    ("text-align: right", "text-right", "Right align text"),
+    ("text-decoration: underline", "underline", "Underlined text"),
+    ("text-decoration: none", "no-underline", "Remove text decoration"),
+    ("line-height: 1.5", "leading-6", "Line height 1.5"),
+    ("letter-spacing: 1px", "tracking-wide", "Wide letter spacing"),
+)
+
+# Background and border properties
+BACKGROUND_BORDER_PROPERTIES = (
+    ("background-color: white", "bg-white", "White background"),
+    ("background-color: black", "bg-black", "Black background"),
+    ("background-color: blue", "bg-blue-500", "Blue background"),
+    ("background-color: transparent", "bg-transparent", "Transparent background"),
+    ("border: 1px solid black", "border border-black", "1px solid black border"),
+    ("border: 2px solid red", "border-2 border-red-500", "2px solid red border"),
+    ("border: none", "border-none", "No border"),
+    ("border-radius: 4px", "rounded", "Rounded corners"),
+    ("border-radius: 8px", "rounded-lg", "Large rounded corners"),
+    ("border-radius: 50%", "rounded-full", "Fully rounded (circle)"),
+    ("box-shadow: 0 4px 6px rgba(0,0,0,0.1)", "shadow-md", "Medium shadow"),
+    ("box-shadow: none", "shadow-none", "No shadow"),
+    ("opacity: 0.5", "opacity-50", "50% opacity"),
+    ("opacity: 1", "opacity-100", "Full opacity"),
+)
+
+# Section titles paired with their property rows, in page order
+SECTIONS = (
+    ("🏗️ Layout & Positioning", LAYOUT_PROPERTIES),
+    ("📏 Spacing (Margin & Padding)", SPACING_PROPERTIES),
+    ("📐 Sizing (Width & Height)", SIZING_PROPERTIES),
+    ("✍️ Typography & Text", TEXT_PROPERTIES),
+    ("🎨 Background & Borders", BACKGROUND_BORDER_PROPERTIES),
+)
+
+# Left and right padding of every comparison table cell in points, used by
+# the TableStyle and by the check for text that fits its column unwrapped
+CELL_PADDING = 8
+
+# Markup for the highlight boxes at the end of the sheet
+EXAMPLES_TEXT = """
+<b>🚀 Common Patterns & Examples:</b><br/>
+<br/>
+<b>Center a Div:</b><br/>
+CSS: <font color='#DC2626'>margin: 0 auto; width: fit-content;</font><br/>
+Tailwind: <font color='#7C3AED'>mx-auto w-fit</font><br/>
+<br/>
+<b>Card Component:</b><br/>
+CSS: <font color='#DC2626'>background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);</font><br/>
+Tailwind: <font color='#7C3AED'>bg-white p-4 rounded-lg shadow-md</font><br/>
+<br/>
+<b>Button Style:</b><br/>
+CSS: <font color='#DC2626'>background: blue; color: white; padding: 0.5rem 1rem; border: none; border-radius: 4px;</font><br/>
+Tailwind: <font color='#7C3AED'>bg-blue-500 text-white py-2 px-4 border-none rounded</font><br/>
+<br/>
+<b>Full Height Container:</b><br/>
+CSS: <font color='#DC2626'>min-height: 100vh; display: flex; flex-direction: column;</font><br/>
+Tailwind: <font color='#7C3AED'>min-h-screen flex flex-col</font><br/>
+<br/>
+<b>Responsive Text:</b><br/>
+CSS: <font color='#DC2626'>font-size: 1rem;</font> + media queries<br/>
+Tailwind: <font color='#7C3AED'>text-base md:text-lg lg:text-xl</font><br/>
+<br/>
+<b>Hide on Mobile:</b><br/>
+CSS: <font color='#DC2626'>@media (max-width: 768px) { display: none; }</font><br/>
+Tailwind: <font color='#7C3AED'>hidden md:block</font><br/>
+<br/>
+<b>Hover Effects:</b><br/>
+CSS: <font color='#DC2626'>transition: all 0.3s ease; &:hover { transform: scale(1.05); }</font><br/>
+Tailwind: <font color='#7C3AED'>transition-all duration-300 hover:scale-105</font>
+"""
+
+TIPS_TEXT = """
+<b>💡 Tips & Best Practices:</b><br/>
+<br/>
+<b>Getting Started with Tailwind:</b><br/>
+• Add Tailwind CDN: <font color='#7C3AED'><b>&lt;script src="https://cdn.tailwindcss.com"&gt;&lt;/script&gt;</b></font><br/>
+• Or install via npm: <font color='#7C3AED'><b>npm install tailwindcss</b></font><br/>
+• Classes are applied directly in HTML: <font color='#7C3AED'><b>&lt;div class="bg-blue-500 text-white p-4"&gt;</b></font><br/>
+<br/>
+<b>Spacing Scale:</b><br/>
+• <font color='#7C3AED'><b>0</b></font> = 0px, <font color='#7C3AED'><b>1</b></font> = 0.25rem (4px), <font color='#7C3AED'><b>2</b></font> = 0.5rem (8px), <font color='#7C3AED'><b>4</b></font> = 1rem (16px)<br/>
+• <font color='#7C3AED'><b>8</b></font> = 2rem (32px), <font color='#7C3AED'><b>16</b></font> = 4rem (64px), <font color='#7C3AED'><b>32</b></font> = 8rem (128px)<br/>
+• Use consistent spacing: <font color='#7C3AED'><b>p-4 m-2 gap-4</b></font> for harmonious layouts<br/>
+<br/>
+<b>Color System:</b><br/>
+• Colors range from 50 (lightest) to 950 (darkest)<br/>
+• <font color='#7C3AED'><b>blue-100</b></font> (very light) to <font color='#7C3AED'><b>blue-900</b></font> (very dark)<br/>
+• Use <font color='#7C3AED'><b>500</b></font> as the default shade for most colors<br/>
+<br/>
+<b>Responsive Design:</b><br/>
+• <font color='#7C3AED'><b>sm:</b></font> ≥640px, <font color='#7C3AED'><b>md:</b></font> ≥768px, <font color='#7C3AED'><b>lg:</b></font> ≥1024px, <font color='#7C3AED'><b>xl:</b></font> ≥1280px<br/>
+• Mobile-first: start with base classes, add breakpoint prefixes<br/>
+• Example: <font color='#7C3AED'><b>text-sm md:text-base lg:text-lg</b></font><br/>
+<br/>
+<b>Common Mistakes:</b><br/>
+• Don't mix CSS and Tailwind classes unnecessarily<br/>
+• Use <font color='#7C3AED'><b>space-x-*</b></font> and <font color='#7C3AED'><b>space-y-*</b></font> for consistent spacing between children<br/>
+• Remember: Tailwind classes are purged in production (unused classes removed)<br/>
+<br/>
+<b>Debugging:</b><br/>
+• Add background colors to visualize layouts: <font color='#7C3AED'><b>bg-red-200</b></font><br/>
+• Use browser dev tools to see applied styles<br/>
+• Tailwind CSS IntelliSense extension for VS Code is very helpful
+"""
 
 class BasicCSSCheatSheetPDF:
     def __init__(self, filename="basic_css_tailwind_cheat_sheet.pdf"):
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import cm
+        from reportlab.lib.colors import HexColor
+        from reportlab.platypus import SimpleDocTemplate, Spacer
+
         self.filename = filename
-        self.doc = SimpleDocTemplate(filename, pagesize=A4,
+        self.file_size = None
+        # The document is rendered into memory and written to disk in one go
+        self._buffer = io.BytesIO()
+        self.doc = SimpleDocTemplate(self._buffer, pagesize=A4,
                                    rightMargin=1*cm, leftMargin=1*cm,
-                                   topMargin=1.5*cm, bottomMargin=1*cm)
+                                   topMargin=1.5*cm, bottomMargin=1*cm,
+                                   pageCompression=1, invariant=1)
         self.styles = getSampleStyleSheet()
         self.story = []
+        self._section_gap = Spacer(1, 0.3*cm)
 
         # Define color scheme
         self.colors = {
@@ -31,13 +213,25 @@ class BasicCSSCheatSheetPDF:
             'description': HexColor('#374151'), # Gray
             'background': HexColor('#F9FAFB'),  # Light gray
             'accent': HexColor('#F59E0B'),      # Amber
+            'examples_bg': HexColor('#F0FDF4'), # Mint for examples box
+            'tips_bg': HexColor('#FEF3C7'),     # Cream for tips box
         }
 
+        # Inline <font> markup for cells that need a wrapping Paragraph; the
+        # colour is formatted in once, leaving a single %s for the cell text
+        self._css_markup = "<font name='Courier-Bold' color='%s'>%%s</font>" % self.colors['css'].hexval()
+        self._tw_markup = "<font name='Courier-Bold' color='%s'>%%s</font>" % self.colors['tailwind'].hexval()
+
         # Custom styles
         self.create_custom_styles()
+        self.create_table_styles()
 
     def create_custom_styles(self):
         """Create custom paragraph styles"""
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.units import cm
+        from reportlab.lib.enums import TA_CENTER
+
         # Main title style
         self.styles.add(ParagraphStyle(
             name='MainTitle',
@@ -71,285 +265,165 @@ class BasicCSSCheatSheetPDF:
             fontName='Helvetica'
         ))
 
-    def create_comparison_table(self, title, properties):
-        """Create a formatted table for CSS vs Tailwind comparison"""
-        # Add section header
-        self.story.append(Paragraph(title, self.styles['SectionHeader']))
+        # Highlight box styles: the paragraph draws its own background and
+        # border, inset to a 17cm box centred in the frame
+        box_indent = 1*cm + 12
+        self.styles.add(ParagraphStyle(
+            name='ExamplesBox',
+            parent=self.styles['Normal'],
+            leftIndent=box_indent,
+            rightIndent=box_indent,
+            spaceBefore=10,
+            spaceAfter=10,
+            backColor=self.colors['examples_bg'],
+            borderColor=self.colors['section'],
+            borderWidth=1,
+            borderPadding=(10, 12)
+        ))
 
-        # Prepare table data
-        data = [['CSS Property', 'Tailwind Class', 'Description']]
-        for css, tailwind, desc in properties:
-            data.append([
-                Paragraph(f"<font name='Courier-Bold' color='{self.colors['css'].hexval()}'>{css}</font>", self.styles['Normal']),
-                Paragraph(f"<font name='Courier-Bold' color='{self.colors['tailwind'].hexval()}'>{tailwind}</font>", self.styles['Normal']),
-                Paragraph(desc, self.styles['Normal'])
-            ])
+        self.styles.add(ParagraphStyle(
+            name='TipsBox',
+            parent=self.styles['ExamplesBox'],
+            backColor=self.colors['tips_bg'],
+            borderColor=self.colors['accent']
+        ))
 
-        # Create table
-        col_widths = [6*cm, 5*cm, 6*cm]
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
+        # Resolve the styles used while building the story once, instead of
+        # a stylesheet lookup per Paragraph
+        self._normal_style = self.styles['Normal']
+        self._main_title_style = self.styles['MainTitle']
+        self._subtitle_style = self.styles['Subtitle']
+        self._section_style = self.styles['SectionHeader']
+        self._examples_style = self.styles['ExamplesBox']
+        self._tips_style = self.styles['TipsBox']
+
+    def create_table_styles(self):
+        """Create the table styles shared by every table of the same kind"""
+        from reportlab.lib.colors import black, white
+        from reportlab.platypus import TableStyle
+
+        # Comparison table style; all spans are relative so one instance
+        # serves every section regardless of row count
+        self.table_style = TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), self.colors['header']),
             ('BACKGROUND', (0, 1), (-1, -1), self.colors['background']),
             ('TEXTCOLOR', (0, 0), (-1, 0), white),
             ('TEXTCOLOR', (0, 1), (-1, -1), black),
+            ('TEXTCOLOR', (0, 1), (0, -1), self.colors['css']),
+            ('TEXTCOLOR', (1, 1), (1, -1), self.colors['tailwind']),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('FONTNAME', (0, 1), (1, -1), 'Courier-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('LEADING', (0, 1), (-1, -1), 12),
             ('GRID', (0, 0), (-1, -1), 0.5, self.colors['section']),
             ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, self.colors['background']]),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), CELL_PADDING),
+            ('RIGHTPADDING', (0, 0), (-1, -1), CELL_PADDING),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        ])
+
+    def create_comparison_table(self, properties):
+        """Create a formatted table for CSS vs Tailwind comparison"""
+        from reportlab.lib.units import cm
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from reportlab.platypus import Table, Paragraph
+
+        # Prepare table data: cells are plain strings styled by the shared
+        # TableStyle column spans; only text too wide for its column (or a
+        # description carrying markup) falls back to a wrapping Paragraph
+        data = [['CSS Property', 'Tailwind Class', 'Description']]
+        col_widths = [6*cm, 5*cm, 6*cm]
+        css_width = col_widths[0] - 2*CELL_PADDING
+        tailwind_width = col_widths[1] - 2*CELL_PADDING
+        desc_width = col_widths[2] - 2*CELL_PADDING
+        normal_style = self._normal_style
+        css_markup = self._css_markup
+        tw_markup = self._tw_markup
+        append = data.append
+        for css, tailwind, desc in properties:
+            if stringWidth(css, 'Courier-Bold', 10) > css_width:
+                css = Paragraph(css_markup % css, normal_style)
+            if stringWidth(tailwind, 'Courier-Bold', 10) > tailwind_width:
+                tailwind = Paragraph(tw_markup % tailwind, normal_style)
+            if '<' in desc or '&' in desc or stringWidth(desc, 'Helvetica', 10) > desc_width:
+                desc = Paragraph(desc, normal_style)
+            append([css, tailwind, desc])
 
-        self.story.append(table)
-        self.story.append(Spacer(1, 0.3*cm))
+        # Create table
+        table = Table(data, colWidths=col_widths, repeatRows=1)
+        table.setStyle(self.table_style)
         return table
 
-    def add_title(self):
-        """Add the main title"""
-        title = Paragraph("📝 Basic CSS vs Tailwind CSS", self.styles['MainTitle'])
-        subtitle = Paragraph("Essential Styling Properties Cheat Sheet", self.styles['Subtitle'])
-        self.story.append(title)
-        self.story.append(subtitle)
-        self.story.append(Spacer(1, 0.5*cm))
-
-    def add_layout_basics(self):
-        """Add basic layout properties"""
-        properties = [
-            ("display: block", "block", "Element takes full width, starts new line"),
-            ("display: inline", "inline", "Element only takes necessary width"),
-            ("display: inline-block", "inline-block", "Inline element with block properties"),
-            ("display: none", "hidden", "Element is completely hidden"),
-            ("display: flex", "flex", "Creates a flex container"),
-            ("display: grid", "grid", "Creates a grid container"),
-            ("position: static", "static", "Default positioning"),
-            ("position: relative", "relative", "Positioned relative to normal position"),
-            ("position: absolute", "absolute", "Positioned relative to nearest positioned parent"),
-            ("position: fixed", "fixed", "Positioned relative to viewport"),
-            ("position: sticky", "sticky", "Switches between relative and fixed"),
-            ("float: left", "float-left", "Element floats to the left"),
-            ("float: right", "float-right", "Element floats to the right"),
-            ("clear: both", "clear-both", "Clears floated elements on both sides"),
-        ]
-        self.create_comparison_table("🏗️ Layout & Positioning", properties)
-
-    def add_spacing_properties(self):
-        """Add margin and padding properties"""
-        properties = [
-            ("margin: 0", "m-0", "No margin on all sides"),
-            ("margin: 1rem", "m-4", "1rem margin on all sides"),
-            ("margin-top: 0.5rem", "mt-2", "0.5rem margin on top"),
-            ("margin-bottom: 1rem", "mb-4", "1rem margin on bottom"),
-            ("margin-left: 2rem", "ml-8", "2rem margin on left"),
-            ("margin-right: 2rem", "mr-8", "2rem margin on right"),
-            ("margin: 0 auto", "mx-auto", "Horizontal centering"),
-            ("padding: 0", "p-0", "No padding on all sides"),
-            ("padding: 1rem", "p-4", "1rem padding on all sides"),
-            ("padding-top: 0.5rem", "pt-2", "0.5rem padding on top"),
-            ("padding-bottom: 1rem", "pb-4", "1rem padding on bottom"),
-            ("padding-left: 2rem", "pl-8", "2rem padding on left"),
-            ("padding-right: 2rem", "pr-8", "2rem padding on right"),
-            ("padding: 1rem 2rem", "px-8 py-4", "Horizontal and vertical padding"),
-        ]
-        self.create_comparison_table("📏 Spacing (Margin & Padding)", properties)
-
-    def add_sizing_properties(self):
-        """Add width and height properties"""
-        properties = [
-            ("width: 100%", "w-full", "Full width"),
-            ("width: 50%", "w-1/2", "Half width"),
-            ("width: 25%", "w-1/4", "Quarter width"),
-            ("width: auto", "w-auto", "Auto width"),
-            ("width: 100px", "w-24", "Fixed width (100px ≈ 6rem)"),
-            ("max-width: 100%", "max-w-full", "Maximum width 100%"),
-            ("min-width: 0", "min-w-0", "Minimum width 0"),
-            ("height: 100%", "h-full", "Full height"),
-            ("height: 100vh", "h-screen", "Full viewport height"),
-            ("height: 50%", "h-1/2", "Half height"),
-            ("height: auto", "h-auto", "Auto height"),
-            ("max-height: 100vh", "max-h-screen", "Maximum height of viewport"),
-            ("min-height: 100vh", "min-h-screen", "Minimum height of viewport"),
-        ]
-        self.create_comparison_table("📐 Sizing (Width & Height)", properties)
-
-    def add_text_properties(self):
-        """Add text and typography properties"""
-        properties = [
-            ("color: black", "text-black", "Black text color"),
-            ("color: white", "text-white", "White text color"),
-            ("color: red", "text-red-500", "Red text color"),
-            ("font-size: 12px", "text-xs", "Extra small font size"),
-            ("font-size: 14px", "text-sm", "Small font size"),
-            ("font-size: 16px", "text-base", "Base font size (default)"),
-            ("font-size: 18px", "text-lg", "Large font size"),
-            ("font-size: 24px", "text-2xl", "Extra large font size"),
-            ("font-weight: normal", "font-normal", "Normal font weight"),
-            ("font-weight: bold", "font-bold", "Bold font weight"),
-            ("text-align: left", "text-left", "Left align text"),
-            ("text-align: center", "text-center", "Center align text"),
-            ("text-align: right", "text-right", "Right align text"),
-            ("text-decoration: underline", "underline", "Underlined text"),
-            ("text-decoration: none", "no-underline", "Remove text decoration"),
-            ("line-height: 1.5", "leading-6", "Line height 1.5"),
-            ("letter-spacing: 1px", "tracking-wide", "Wide letter spacing"),
+    def create_title(self):
+        """Create the main title flowables"""
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Paragraph, Spacer
+
+        return [
+            Paragraph("📝 Basic CSS vs Tailwind CSS", self._main_title_style),
+            Paragraph("Essential Styling Properties Cheat Sheet", self._subtitle_style),
+            Spacer(1, 0.5*cm),
         ]
-        self.create_comparison_table("✍️ Typography & Text", properties)
-
-    def add_background_border(self):
-        """Add background and border properties"""
-        properties = [
-            ("background-color: white", "bg-white", "White background"),
-            ("background-color: black", "bg-black", "Black background"),
-            ("background-color: blue", "bg-blue-500", "Blue background"),
-            ("background-color: transparent", "bg-transparent", "Transparent background"),
-            ("border: 1px solid black", "border border-black", "1px solid black border"),
-            ("border: 2px solid red", "border-2 border-red-500", "2px solid red border"),
-            ("border: none", "border-none", "No border"),
-            ("border-radius: 4px", "rounded", "Rounded corners"),
-            ("border-radius: 8px", "rounded-lg", "Large rounded corners"),
-            ("border-radius: 50%", "rounded-full", "Fully rounded (circle)"),
-            ("box-shadow: 0 4px 6px rgba(0,0,0,0.1)", "shadow-md", "Medium shadow"),
-            ("box-shadow: none", "shadow-none", "No shadow"),
-            ("opacity: 0.5", "opacity-50", "50% opacity"),
-            ("opacity: 1", "opacity-100", "Full opacity"),
+
+    def create_section(self, title, properties):
+        """Create the header, comparison table and trailing gap of a section"""
+        from reportlab.platypus import Paragraph
+
+        return [
+            Paragraph(title, self._section_style),
+            self.create_comparison_table(properties),
+            self._section_gap,
         ]
-        self.create_comparison_table("🎨 Background & Borders", properties)
-
-    def add_common_patterns(self):
-        """Add common CSS patterns"""
-        examples_text = """
-        <b>🚀 Common Patterns & Examples:</b><br/>
-        <br/>
-        <b>Center a Div:</b><br/>
-        CSS: <font color='#DC2626'>margin: 0 auto; width: fit-content;</font><br/>
-        Tailwind: <font color='#7C3AED'>mx-auto w-fit</font><br/>
-        <br/>
-        <b>Card Component:</b><br/>
-        CSS: <font color='#DC2626'>background: white; padding: 1rem; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);</font><br/>
-        Tailwind: <font color='#7C3AED'>bg-white p-4 rounded-lg shadow-md</font><br/>
-        <br/>
-        <b>Button Style:</b><br/>
-        CSS: <font color='#DC2626'>background: blue; color: white; padding: 0.5rem 1rem; border: none; border-radius: 4px;</font><br/>
-        Tailwind: <font color='#7C3AED'>bg-blue-500 text-white py-2 px-4 border-none rounded</font><br/>
-        <br/>
-        <b>Full Height Container:</b><br/>
-        CSS: <font color='#DC2626'>min-height: 100vh; display: flex; flex-direction: column;</font><br/>
-        Tailwind: <font color='#7C3AED'>min-h-screen flex flex-col</font><br/>
-        <br/>
-        <b>Responsive Text:</b><br/>
-        CSS: <font color='#DC2626'>font-size: 1rem;</font> + media queries<br/>
-        Tailwind: <font color='#7C3AED'>text-base md:text-lg lg:text-xl</font><br/>
-        <br/>
-        <b>Hide on Mobile:</b><br/>
-        CSS: <font color='#DC2626'>@media (max-width: 768px) { display: none; }</font><br/>
-        Tailwind: <font color='#7C3AED'>hidden md:block</font><br/>
-        <br/>
-        <b>Hover Effects:</b><br/>
-        CSS: <font color='#DC2626'>transition: all 0.3s ease; &:hover { transform: scale(1.05); }</font><br/>
-        Tailwind: <font color='#7C3AED'>transition-all duration-300 hover:scale-105</font>
-        """
-
-        examples_para = Paragraph(examples_text, self.styles['Normal'])
-
-        # Create a colored background table for examples
-        examples_table = Table([[examples_para]], colWidths=[17*cm])
-        examples_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#F0FDF4')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), self.colors['description']),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, self.colors['section']),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
-
-        self.story.append(examples_table)
-        self.story.append(Spacer(1, 0.3*cm))
-
-    def add_tips_section(self):
-        """Add tips and best practices"""
-        tips_text = """
-        <b>💡 Tips & Best Practices:</b><br/>
-        <br/>
-        <b>Getting Started with Tailwind:</b><br/>
-        • Add Tailwind CDN: <font color='#7C3AED'><b>&lt;script src="https://cdn.tailwindcss.com"&gt;&lt;/script&gt;</b></font><br/>
-        • Or install via npm: <font color='#7C3AED'><b>npm install tailwindcss</b></font><br/>
-        • Classes are applied directly in HTML: <font color='#7C3AED'><b>&lt;div class="bg-blue-500 text-white p-4"&gt;</b></font><br/>
-        <br/>
-        <b>Spacing Scale:</b><br/>
-        • <font color='#7C3AED'><b>0</b></font> = 0px, <font color='#7C3AED'><b>1</b></font> = 0.25rem (4px), <font color='#7C3AED'><b>2</b></font> = 0.5rem (8px), <font color='#7C3AED'><b>4</b></font> = 1rem (16px)<br/>
-        • <font color='#7C3AED'><b>8</b></font> = 2rem (32px), <font color='#7C3AED'><b>16</b></font> = 4rem (64px), <font color='#7C3AED'><b>32</b></font> = 8rem (128px)<br/>
-        • Use consistent spacing: <font color='#7C3AED'><b>p-4 m-2 gap-4</b></font> for harmonious layouts<br/>
-        <br/>
-        <b>Color System:</b><br/>
-        • Colors range from 50 (lightest) to 950 (darkest)<br/>
-        • <font color='#7C3AED'><b>blue-100</b></font> (very light) to <font color='#7C3AED'><b>blue-900</b></font> (very dark)<br/>
-        • Use <font color='#7C3AED'><b>500</b></font> as the default shade for most colors<br/>
-        <br/>
-        <b>Responsive Design:</b><br/>
-        • <font color='#7C3AED'><b>sm:</b></font> ≥640px, <font color='#7C3AED'><b>md:</b></font> ≥768px, <font color='#7C3AED'><b>lg:</b></font> ≥1024px, <font color='#7C3AED'><b>xl:</b></font> ≥1280px<br/>
-        • Mobile-first: start with base classes, add breakpoint prefixes<br/>
-        • Example: <font color='#7C3AED'><b>text-sm md:text-base lg:text-lg</b></font><br/>
-        <br/>
-        <b>Common Mistakes:</b><br/>
-        • Don't mix CSS and Tailwind classes unnecessarily<br/>
-        • Use <font color='#7C3AED'><b>space-x-*</b></font> and <font color='#7C3AED'><b>space-y-*</b></font> for consistent spacing between children<br/>
-        • Remember: Tailwind classes are purged in production (unused classes removed)<br/>
-        <br/>
-        <b>Debugging:</b><br/>
-        • Add background colors to visualize layouts: <font color='#7C3AED'><b>bg-red-200</b></font><br/>
-        • Use browser dev tools to see applied styles<br/>
-        • Tailwind CSS IntelliSense extension for VS Code is very helpful
-        """
-
-        tips_para = Paragraph(tips_text, self.styles['Normal'])
-
-        # Create a colored background table for tips
-        tips_table = Table([[tips_para]], colWidths=[17*cm])
-        tips_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#FEF3C7')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), self.colors['description']),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, self.colors['accent']),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
 
-        self.story.append(tips_table)
+    def create_common_patterns(self):
+        """Create the common CSS patterns box"""
+        from reportlab.platypus import KeepTogether
+
+        # Single boxed paragraph; no wrapping table needed for the background.
+        # KeepTogether moves the box to the next page instead of cutting it
+        return [KeepTogether([cached_paragraph(EXAMPLES_TEXT, self._examples_style)]), self._section_gap]
+
+    def create_tips_section(self):
+        """Create the tips and best practices box"""
+        from reportlab.platypus import KeepTogether
+
+        # Single boxed paragraph, kept whole like the patterns box
+        return [KeepTogether([cached_paragraph(TIPS_TEXT, self._tips_style)])]
 
     def generate_pdf(self):
         """Generate the complete PDF"""
-        # Add all sections
-        self.add_title()
-        self.add_layout_basics()
-        self.add_spacing_properties()
-        self.add_sizing_properties()
-        self.add_text_properties()
-        self.add_background_border()
-        self.add_common_patterns()
-        self.add_tips_section()
+        # Assemble the whole story in one pass from the per-part flowables
+        self.story = list(chain(
+            self.create_title(),
+            *(self.create_section(title, properties) for title, properties in SECTIONS),
+            self.create_common_patterns(),
+            self.create_tips_section(),
+        ))
 
         # Build PDF
         self.doc.build(self.story)
+        pdf_bytes = self._buffer.getvalue()
+        with open(self.filename, 'wb') as pdf_file:
+            pdf_file.write(pdf_bytes)
+        self.file_size = len(pdf_bytes)
         print(f"✅ Basic CSS/Tailwind Cheat Sheet PDF generated successfully: {self.filename}")
         return self.filename
 
+# Module-level (and therefore picklable) entry point, so a batch driver can
+# build several cheat sheets in parallel with a ProcessPoolExecutor
+def build_pdf(filename="basic_css_tailwind_cheat_sheet.pdf"):
+    """Build the cheat sheet PDF and return its filename"""
+    return BasicCSSCheatSheetPDF(filename).generate_pdf()
+
 def main():
     """Main function to generate the PDF"""
+    from datetime import datetime
+
     try:
         # Create PDF generator
         pdf_generator = BasicCSSCheatSheetPDF("basic_css_tailwind_cheat_sheet.pdf")
@@ -358,17 +432,20 @@ def main():
         filename = pdf_generator.generate_pdf()
 
         print(f"\n📝 Basic CSS/Tailwind Cheat Sheet PDF created: {filename}")
-        print(f"📄 File size: {os.path.getsize(filename)} bytes")
+        print(f"📄 File size: {pdf_generator.file_size} bytes")
         print(f"📅 Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-        # Try to open the PDF (platform-specific)
+        # Try to open the PDF (platform-specific), without going through a shell
         import platform
-        if platform.system() == "Darwin":  # macOS
-            os.system(f"open {filename}")
-        elif platform.system() == "Windows":
-            os.system(f"start {filename}")
-        else:  # Linux
-            os.system(f"xdg-open {filename}")
+        import subprocess
+        try:
+            if platform.system() == "Windows":
+                os.startfile(filename)
+            else:
+                opener = "open" if platform.system() == "Darwin" else "xdg-open"
+                subprocess.Popen([opener, filename], start_new_session=True)
+        except OSError:
+            print("⚠️ Could not open the PDF automatically")
 
     except ImportError as e:
         print("❌ Required library not found!")
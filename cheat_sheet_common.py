@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the cheat sheet PDF generators
+Imports no reportlab at module level, so the generators stay cheap to import
+"""
+
+import hashlib
+import os
+from importlib.util import find_spec
+
+def rl_accel_available():
+    """Report whether reportlab's optional C accelerator is installed"""
+    # Text measuring and PDF encoding are much faster with the _rl_accel
+    # extension; only its presence is probed, so this can never fail a build
+    return find_spec('_rl_accel') is not None
+
+# Parsed paragraph fragments keyed by (markup, style object), shared by every
+# generator in the process so identical markup goes through the parser once.
+# Generators reuse style names with different fonts and sizes, so the key is
+# the style's identity; each entry keeps its style alive so the id is never
+# reused by another style
+_PARSED_FRAGS = {}
+
+def cached_paragraph(text, style):
+    """Create a Paragraph, reusing the parsed fragments of identical markup"""
+    from reportlab.platypus import Paragraph
+
+    key = (text, id(style))
+    entry = _PARSED_FRAGS.get(key)
+    if entry is None:
+        paragraph = Paragraph(text, style)
+        _PARSED_FRAGS[key] = (style, paragraph.frags)
+        return paragraph
+    return Paragraph(text, style, frags=entry[1])
+
+def content_key(source_path):
+    """Hash everything a PDF depends on: its generator, these helpers and reportlab"""
+    import reportlab
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (source_path, __file__):
+        with open(path, 'rb') as source:
+            digest.update(source.read())
+    digest.update(reportlab.Version.encode())
+    return digest.hexdigest()
+
+def pdf_is_current(filename, key):
+    """Report whether the PDF on disk was built from the given content key"""
+    # The key lives in a sidecar file next to the PDF
+    key_path = filename + '.key'
+    if not (os.path.exists(filename) and os.path.exists(key_path)):
+        return False
+    with open(key_path) as key_file:
+        return key_file.read() == key
+
+def write_pdf(filename, pdf_bytes, key):
+    """Write a PDF rendered in memory, then record the key it was built from"""
+    # The key is written last, so an interrupted write never looks up to date
+    with open(filename, 'wb') as pdf_file:
+        pdf_file.write(pdf_bytes)
+    with open(filename + '.key', 'w') as key_file:
+        key_file.write(key)
@@ -8,33 +8,168 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
 from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import Table, TableStyle, Spacer, PageBreak
+from reportlab.platypus.frames import Frame
+from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.pdfbase.pdfmetrics import stringWidth
+import io
 import os
 from datetime import datetime
+from itertools import chain
+from cheat_sheet_common import cached_paragraph, content_key, pdf_is_current, write_pdf
+
+# Flex container properties as (CSS, Tailwind, description)
+CONTAINER_PROPERTIES = (
+    ("display: flex", "flex", "Makes element a flex container"),
+    ("flex-direction: row", "flex-row", "Items flow horizontally (default)"),
+    ("flex-direction: row-reverse", "flex-row-reverse", "Items flow horizontally in reverse"),
+    ("flex-direction: column", "flex-col", "Items flow vertically"),
+    ("flex-direction: column-reverse", "flex-col-reverse", "Items flow vertically in reverse"),
+    ("flex-wrap: nowrap", "flex-nowrap", "Items stay on single line (default)"),
+    ("flex-wrap: wrap", "flex-wrap", "Items wrap to next line if needed"),
+    ("flex-wrap: wrap-reverse", "flex-wrap-reverse", "Items wrap in reverse order"),
+    ("justify-content: flex-start", "justify-start", "Items align to start of container"),
+    ("justify-content: flex-end", "justify-end", "Items align to end of container"),
+    ("justify-content: center", "justify-center", "Items align to center of container"),
+    ("justify-content: space-between", "justify-between", "Items evenly distributed with space between"),
+    ("justify-content: space-around", "justify-around", "Items evenly distributed with space around"),
+    ("justify-content: space-evenly", "justify-evenly", "Items evenly distributed with equal space"),
+    ("align-items: stretch", "items-stretch", "Items stretch to fill container height (default)"),
+    ("align-items: flex-start", "items-start", "Items align to top of container"),
+    ("align-items: flex-end", "items-end", "Items align to bottom of container"),
+    ("align-items: center", "items-center", "Items align to vertical center of container"),
+    ("align-items: baseline", "items-baseline", "Items align to their baselines"),
+    ("align-content: stretch", "content-stretch", "Lines stretch to fill container (default)"),
+    ("align-content: flex-start", "content-start", "Lines align to start of container"),
+    ("align-content: flex-end", "content-end", "Lines align to end of container"),
+    ("align-content: center", "content-center", "Lines align to center of container"),
+    ("align-content: space-between", "content-between", "Lines evenly distributed with space between"),
+    ("align-content: space-around", "content-around", "Lines evenly distributed with space around"),
+)
+
+# Flex item properties as (CSS, Tailwind, description)
+ITEM_PROPERTIES = (
+    ("flex-grow: 0", "flex-grow-0", "Item doesn't grow (default)"),
+    ("flex-grow: 1", "flex-grow", "Item grows to fill available space"),
+    ("flex-shrink: 1", "flex-shrink", "Item can shrink if needed (default)"),
+    ("flex-shrink: 0", "flex-shrink-0", "Item doesn't shrink"),
+    ("flex-basis: auto", "flex-auto", "Item size based on content or width/height"),
+    ("flex-basis: 0", "flex-initial", "Item size based on content only"),
+    ("flex: 1", "flex-1", "flex: 1 1 0% (grows, shrinks, no basis)"),
+    ("flex: none", "flex-none", "flex: 0 0 auto (no grow/shrink)"),
+    ("align-self: auto", "self-auto", "Item uses parent's align-items (default)"),
+    ("align-self: flex-start", "self-start", "Item aligns to start of cross axis"),
+    ("align-self: flex-end", "self-end", "Item aligns to end of cross axis"),
+    ("align-self: center", "self-center", "Item aligns to center of cross axis"),
+    ("align-self: stretch", "self-stretch", "Item stretches to fill cross axis"),
+    ("align-self: baseline", "self-baseline", "Item aligns to baseline"),
+    ("order: 0", "order-0", "Item appears in normal order (default)"),
+    ("order: 1", "order-1", "Item appears after items with lower order"),
+    ("order: -1", "order-first", "Item appears before all other items"),
+    ("order: 9999", "order-last", "Item appears after all other items"),
+)
+
+# Common patterns as (label, CSS, Tailwind, trailing note)
+EXAMPLES = (
+    ("Perfect Centering", "display:flex; justify-content:center; align-items:center; min-h:100vh",
+     "flex justify-center items-center min-h-screen", ""),
+    ("Navigation Bar", "display:flex; justify-content:space-between; align-items:center; padding:1rem",
+     "flex justify-between items-center p-4", ""),
+    ("Card Layout", "display:flex; flex-direction:column; justify-content:space-between; height:300px",
+     "flex flex-col justify-between h-72", ""),
+    ("Responsive Grid", "display:flex; flex-wrap:wrap; gap:1rem; justify-content:center",
+     "flex flex-wrap gap-4 justify-center", ""),
+    ("Equal Width Columns", "display:flex; flex:1", "flex-1", " (on each item)"),
+    ("Sticky Footer", "display:flex; flex-direction:column; min-h:100vh; flex:1",
+     "flex flex-col min-h-screen flex-1", " (on main)"),
+)
+
+# Tips as (heading, bullet markup lines)
+TIPS = (
+    ("Getting Started", (
+        "Always start with <font color='#7C3AED'><b>flex</b></font> class to enable flexbox",
+        "Default direction is row (horizontal), use <font color='#7C3AED'><b>flex-col</b></font> for vertical",
+        "Items stretch by default, use <font color='#7C3AED'><b>items-start</b></font> to prevent",
+    )),
+    ("Axis Understanding", (
+        "<font color='#7C3AED'><b>justify-*</b></font> controls main axis (direction of flex)",
+        "<font color='#7C3AED'><b>items-*</b></font> controls cross axis (perpendicular to main)",
+        "When <font color='#7C3AED'><b>flex-col</b></font>, main axis becomes vertical",
+    )),
+    ("Common Techniques", (
+        "Use <font color='#7C3AED'><b>flex-1</b></font> for equal-width/height growing items",
+        "<font color='#7C3AED'><b>flex-none</b></font> prevents growing/shrinking",
+        "<font color='#7C3AED'><b>gap-*</b></font> adds spacing between items (modern browsers)",
+    )),
+    ("Responsive Design", (
+        "<font color='#7C3AED'><b>md:flex-col lg:flex-row</b></font> for responsive layouts",
+        "<font color='#7C3AED'><b>sm:justify-start md:justify-center</b></font> for breakpoint-specific alignment",
+        "Test on different screen sizes to ensure proper behavior",
+    )),
+    ("Performance", (
+        "Flexbox is hardware-accelerated in modern browsers",
+        "Avoid changing flex direction frequently",
+        "Use <font color='#7C3AED'><b>flex-wrap</b></font> for responsive multi-line layouts",
+    )),
+    ("Debugging", (
+        "Add background colors to visualize containers and items",
+        "Use browser dev tools to inspect flex properties",
+        "Remember: flexbox only affects direct children",
+    )),
+)
+
+# Color scheme
+COLORS = {
+    'header': HexColor('#2563EB'),      # Blue
+    'section': HexColor('#059669'),     # Green
+    'css': HexColor('#DC2626'),         # Red for CSS
+    'tailwind': HexColor('#7C3AED'),    # Purple for Tailwind
+    'description': HexColor('#374151'), # Gray
+    'background': HexColor('#F9FAFB'),  # Light gray
+    'accent': HexColor('#F59E0B'),      # Amber
+}
+
+# Alternating body row colours of the comparison tables
+ROW_BACKGROUNDS = (white, COLORS['background'])
+
+# Column widths in points: comparison tables and the single-column boxes
+COLUMN_WIDTHS = (6*cm, 5*cm, 6*cm)
+BOX_WIDTHS = (17*cm,)
 
 class FlexboxCheatSheetPDF:
+    # Sample stylesheet plus the custom styles, shared by every instance in
+    # the process; the styles only depend on the fixed color scheme
+    _shared_styles = None
+
     def __init__(self, filename="flexbox_cheat_sheet.pdf"):
         self.filename = filename
-        self.doc = SimpleDocTemplate(filename, pagesize=A4,
+        # The document is rendered into memory and written to disk in one go
+        self._buffer = io.BytesIO()
+        self.doc = BaseDocTemplate(self._buffer, pagesize=A4,
                                    rightMargin=1*cm, leftMargin=1*cm,
                                    topMargin=1.5*cm, bottomMargin=1*cm)
-        self.styles = getSampleStyleSheet()
+        # One explicit full-page frame shared by every page; the sheet needs
+        # none of SimpleDocTemplate's first/later page callback plumbing
+        content_frame = Frame(self.doc.leftMargin, self.doc.bottomMargin,
+                              self.doc.width, self.doc.height, id='content')
+        self.doc.addPageTemplates([PageTemplate(id='page', frames=[content_frame])])
         self.story = []
 
-        # Define color scheme
-        self.colors = {
-            'header': HexColor('#2563EB'),      # Blue
-            'section': HexColor('#059669'),     # Green
-            'css': HexColor('#DC2626'),         # Red for CSS
-            'tailwind': HexColor('#7C3AED'),    # Purple for Tailwind
-            'description': HexColor('#374151'), # Gray
-            'background': HexColor('#F9FAFB'),  # Light gray
-            'accent': HexColor('#F59E0B'),      # Amber
-        }
+        # Define color scheme, parsed once at import
+        self.colors = COLORS
+
+        # Hex strings for the examples box markup, computed once
+        self._css_hex = self.colors['css'].hexval()
+        self._tw_hex = self.colors['tailwind'].hexval()
 
-        # Custom styles
-        self.create_custom_styles()
+        # Custom styles, built by the first instance only
+        if FlexboxCheatSheetPDF._shared_styles is None:
+            self.styles = getSampleStyleSheet()
+            self.create_custom_styles()
+            FlexboxCheatSheetPDF._shared_styles = self.styles
+        self.styles = FlexboxCheatSheetPDF._shared_styles
+        self.create_table_styles()
 
     def create_custom_styles(self):
         """Create custom paragraph styles"""
@@ -71,24 +206,35 @@ class FlexboxCheatSheetPDF:
             fontName='Helvetica'
         ))
 
-    def create_comparison_table(self, title, properties):
-        """Create a formatted table for CSS vs Tailwind comparison"""
-        # Add section header
-        self.story.append(Paragraph(title, self.styles['SectionHeader']))
-
-        # Prepare table data
-        data = [['CSS Property', 'Tailwind Class', 'Description']]
-        for css, tailwind, desc in properties:
-            data.append([
-                Paragraph(f"<font name='Courier-Bold' color='{self.colors['css'].hexval()}'>{css}</font>", self.styles['Normal']),
-                Paragraph(f"<font name='Courier-Bold' color='{self.colors['tailwind'].hexval()}'>{tailwind}</font>", self.styles['Normal']),
-                Paragraph(desc, self.styles['Normal'])
-            ])
+        # Code cell styles: font and colour come from the style, so the
+        # cell text needs no inline <font> markup to parse
+        self.styles.add(ParagraphStyle(
+            name='CssCode',
+            parent=self.styles['Normal'],
+            fontName='Courier-Bold',
+            textColor=self.colors['css']
+        ))
 
-        # Create table
-        col_widths = [6*cm, 5*cm, 6*cm]
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
+        self.styles.add(ParagraphStyle(
+            name='TwCode',
+            parent=self.styles['Normal'],
+            fontName='Courier-Bold',
+            textColor=self.colors['tailwind']
+        ))
+
+        # Bold label opening each group in the examples and tips boxes; the
+        # space before stands in for the blank line that separates groups
+        self.styles.add(ParagraphStyle(
+            name='BoxLabel',
+            parent=self.styles['Normal'],
+            spaceBefore=12
+        ))
+
+    def create_table_styles(self):
+        """Create the table styles shared by every table of the same kind"""
+        # All spans are relative, so one instance serves every section
+        # regardless of its row count
+        self.table_style = TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), self.colors['header']),
             ('BACKGROUND', (0, 1), (-1, -1), self.colors['background']),
             ('TEXTCOLOR', (0, 0), (-1, 0), white),
@@ -98,117 +244,18 @@ class FlexboxCheatSheetPDF:
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
             ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('FONTSIZE', (2, 1), (2, -1), 10),
+            ('LEADING', (2, 1), (2, -1), 12),
             ('GRID', (0, 0), (-1, -1), 0.5, self.colors['section']),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, self.colors['background']]),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), ROW_BACKGROUNDS),
             ('LEFTPADDING', (0, 0), (-1, -1), 8),
             ('RIGHTPADDING', (0, 0), (-1, -1), 8),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-
-        self.story.append(table)
-        self.story.append(Spacer(1, 0.3*cm))
-        return table
+        ])
 
-    def add_title(self):
-        """Add the main title"""
-        title = Paragraph("🎨 CSS Flexbox vs Tailwind CSS", self.styles['MainTitle'])
-        subtitle = Paragraph("Face-to-Face Comparison Cheat Sheet", self.styles['Subtitle'])
-        self.story.append(title)
-        self.story.append(subtitle)
-        self.story.append(Spacer(1, 0.5*cm))
-
-
-    def add_container_properties(self):
-        """Add flex container properties"""
-        properties = [
-            ("display: flex", "flex", "Makes element a flex container"),
-            ("flex-direction: row", "flex-row", "Items flow horizontally (default)"),
-            ("flex-direction: row-reverse", "flex-row-reverse", "Items flow horizontally in reverse"),
-            ("flex-direction: column", "flex-col", "Items flow vertically"),
-            ("flex-direction: column-reverse", "flex-col-reverse", "Items flow vertically in reverse"),
-            ("flex-wrap: nowrap", "flex-nowrap", "Items stay on single line (default)"),
-            ("flex-wrap: wrap", "flex-wrap", "Items wrap to next line if needed"),
-            ("flex-wrap: wrap-reverse", "flex-wrap-reverse", "Items wrap in reverse order"),
-            ("justify-content: flex-start", "justify-start", "Items align to start of container"),
-            ("justify-content: flex-end", "justify-end", "Items align to end of container"),
-            ("justify-content: center", "justify-center", "Items align to center of container"),
-            ("justify-content: space-between", "justify-between", "Items evenly distributed with space between"),
-            ("justify-content: space-around", "justify-around", "Items evenly distributed with space around"),
-            ("justify-content: space-evenly", "justify-evenly", "Items evenly distributed with equal space"),
-            ("align-items: stretch", "items-stretch", "Items stretch to fill container height (default)"),
-            ("align-items: flex-start", "items-start", "Items align to top of container"),
-            ("align-items: flex-end", "items-end", "Items align to bottom of container"),
-            ("align-items: center", "items-center", "Items align to vertical center of container"),
-            ("align-items: baseline", "items-baseline", "Items align to their baselines"),
-            ("align-content: stretch", "content-stretch", "Lines stretch to fill container (default)"),
-            ("align-content: flex-start", "content-start", "Lines align to start of container"),
-            ("align-content: flex-end", "content-end", "Lines align to end of container"),
-            ("align-content: center", "content-center", "Lines align to center of container"),
-            ("align-content: space-between", "content-between", "Lines evenly distributed with space between"),
-            ("align-content: space-around", "content-around", "Lines evenly distributed with space around"),
-        ]
-        self.create_comparison_table("🔧 Flex Container Properties", properties)
-
-    def add_item_properties(self):
-        """Add flex item properties"""
-        properties = [
-            ("flex-grow: 0", "flex-grow-0", "Item doesn't grow (default)"),
-            ("flex-grow: 1", "flex-grow", "Item grows to fill available space"),
-            ("flex-shrink: 1", "flex-shrink", "Item can shrink if needed (default)"),
-            ("flex-shrink: 0", "flex-shrink-0", "Item doesn't shrink"),
-            ("flex-basis: auto", "flex-auto", "Item size based on content or width/height"),
-            ("flex-basis: 0", "flex-initial", "Item size based on content only"),
-            ("flex: 1", "flex-1", "flex: 1 1 0% (grows, shrinks, no basis)"),
-            ("flex: none", "flex-none", "flex: 0 0 auto (no grow/shrink)"),
-            ("align-self: auto", "self-auto", "Item uses parent's align-items (default)"),
-            ("align-self: flex-start", "self-start", "Item aligns to start of cross axis"),
-            ("align-self: flex-end", "self-end", "Item aligns to end of cross axis"),
-            ("align-self: center", "self-center", "Item aligns to center of cross axis"),
-            ("align-self: stretch", "self-stretch", "Item stretches to fill cross axis"),
-            ("align-self: baseline", "self-baseline", "Item aligns to baseline"),
-            ("order: 0", "order-0", "Item appears in normal order (default)"),
-            ("order: 1", "order-1", "Item appears after items with lower order"),
-            ("order: -1", "order-first", "Item appears before all other items"),
-            ("order: 9999", "order-last", "Item appears after all other items"),
-        ]
-        self.create_comparison_table("📦 Flex Item Properties", properties)
-
-    def add_examples_section(self):
-        """Add practical examples"""
-        examples_text = """
-        <b>🚀 Common Patterns:</b><br/>
-        <br/>
-        <b>Perfect Centering:</b><br/>
-        CSS: <font color='#DC2626'>display:flex; justify-content:center; align-items:center; min-h:100vh</font><br/>
-        Tailwind: <font color='#7C3AED'>flex justify-center items-center min-h-screen</font><br/>
-        <br/>
-        <b>Navigation Bar:</b><br/>
-        CSS: <font color='#DC2626'>display:flex; justify-content:space-between; align-items:center; padding:1rem</font><br/>
-        Tailwind: <font color='#7C3AED'>flex justify-between items-center p-4</font><br/>
-        <br/>
-        <b>Card Layout:</b><br/>
-        CSS: <font color='#DC2626'>display:flex; flex-direction:column; justify-content:space-between; height:300px</font><br/>
-        Tailwind: <font color='#7C3AED'>flex flex-col justify-between h-72</font><br/>
-        <br/>
-        <b>Responsive Grid:</b><br/>
-        CSS: <font color='#DC2626'>display:flex; flex-wrap:wrap; gap:1rem; justify-content:center</font><br/>
-        Tailwind: <font color='#7C3AED'>flex flex-wrap gap-4 justify-center</font><br/>
-        <br/>
-        <b>Equal Width Columns:</b><br/>
-        CSS: <font color='#DC2626'>display:flex; flex:1</font> (on each item)<br/>
-        Tailwind: <font color='#7C3AED'>flex-1</font> (on each item)<br/>
-        <br/>
-        <b>Sticky Footer:</b><br/>
-        CSS: <font color='#DC2626'>display:flex; flex-direction:column; min-h:100vh; flex:1</font> (on main)<br/>
-        Tailwind: <font color='#7C3AED'>flex flex-col min-h-screen flex-1</font> (on main)
-        """
-
-        examples_para = Paragraph(examples_text, self.styles['Normal'])
-
-        # Create a colored background table for examples
-        examples_table = Table([[examples_para]], colWidths=[17*cm])
-        examples_table.setStyle(TableStyle([
+        # Single-cell box styles for the examples and tips sections
+        self.examples_table_style = TableStyle([
             ('BACKGROUND', (0, 0), (-1, -1), HexColor('#F0FDF4')),
             ('TEXTCOLOR', (0, 0), (-1, -1), self.colors['description']),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
@@ -220,52 +267,9 @@ class FlexboxCheatSheetPDF:
             ('RIGHTPADDING', (0, 0), (-1, -1), 12),
             ('TOPPADDING', (0, 0), (-1, -1), 10),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
-
-        self.story.append(examples_table)
-        self.story.append(Spacer(1, 0.3*cm))
-
-    def add_tips_section(self):
-        """Add tips and best practices"""
-        tips_text = """
-        <b>💡 Tips & Best Practices:</b><br/>
-        <br/>
-        <b>Getting Started:</b><br/>
-        • Always start with <font color='#7C3AED'><b>flex</b></font> class to enable flexbox<br/>
-        • Default direction is row (horizontal), use <font color='#7C3AED'><b>flex-col</b></font> for vertical<br/>
-        • Items stretch by default, use <font color='#7C3AED'><b>items-start</b></font> to prevent<br/>
-        <br/>
-        <b>Axis Understanding:</b><br/>
-        • <font color='#7C3AED'><b>justify-*</b></font> controls main axis (direction of flex)<br/>
-        • <font color='#7C3AED'><b>items-*</b></font> controls cross axis (perpendicular to main)<br/>
-        • When <font color='#7C3AED'><b>flex-col</b></font>, main axis becomes vertical<br/>
-        <br/>
-        <b>Common Techniques:</b><br/>
-        • Use <font color='#7C3AED'><b>flex-1</b></font> for equal-width/height growing items<br/>
-        • <font color='#7C3AED'><b>flex-none</b></font> prevents growing/shrinking<br/>
-        • <font color='#7C3AED'><b>gap-*</b></font> adds spacing between items (modern browsers)<br/>
-        <br/>
-        <b>Responsive Design:</b><br/>
-        • <font color='#7C3AED'><b>md:flex-col lg:flex-row</b></font> for responsive layouts<br/>
-        • <font color='#7C3AED'><b>sm:justify-start md:justify-center</b></font> for breakpoint-specific alignment<br/>
-        • Test on different screen sizes to ensure proper behavior<br/>
-        <br/>
-        <b>Performance:</b><br/>
-        • Flexbox is hardware-accelerated in modern browsers<br/>
-        • Avoid changing flex direction frequently<br/>
-        • Use <font color='#7C3AED'><b>flex-wrap</b></font> for responsive multi-line layouts<br/>
-        <br/>
-        <b>Debugging:</b><br/>
-        • Add background colors to visualize containers and items<br/>
-        • Use browser dev tools to inspect flex properties<br/>
-        • Remember: flexbox only affects direct children
-        """
-
-        tips_para = Paragraph(tips_text, self.styles['Normal'])
+        ])
 
-        # Create a colored background table for tips
-        tips_table = Table([[tips_para]], colWidths=[17*cm])
-        tips_table.setStyle(TableStyle([
+        self.tips_table_style = TableStyle([
             ('BACKGROUND', (0, 0), (-1, -1), HexColor('#FEF3C7')),
             ('TEXTCOLOR', (0, 0), (-1, -1), self.colors['description']),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
@@ -277,24 +281,128 @@ class FlexboxCheatSheetPDF:
             ('RIGHTPADDING', (0, 0), (-1, -1), 12),
             ('TOPPADDING', (0, 0), (-1, -1), 10),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        ])
+
+    def create_comparison_table(self, properties):
+        """Create a formatted table for CSS vs Tailwind comparison"""
+        # Prepare table data: header plus one immutable row per property,
+        # built in a single comprehension. Descriptions are plain strings
+        # styled by the TableStyle unless too wide for their column (or
+        # carrying markup characters), where a wrapping Paragraph is needed
+        css_style = self.styles['CssCode']
+        tw_style = self.styles['TwCode']
+        normal_style = self.styles['Normal']
+        desc_width = COLUMN_WIDTHS[2] - 16
+        data = [('CSS Property', 'Tailwind Class', 'Description')]
+        data += [
+            (cached_paragraph(css, css_style),
+             cached_paragraph(tailwind, tw_style),
+             cached_paragraph(desc, normal_style)
+             if '<' in desc or '&' in desc or stringWidth(desc, 'Helvetica', 10) > desc_width
+             else desc)
+            for css, tailwind, desc in properties
+        ]
+
+        # Create table
+        table = Table(data, colWidths=COLUMN_WIDTHS, repeatRows=1)
+        table.setStyle(self.table_style)
+        return table
+
+    def create_section(self, title, properties):
+        """Create the header, comparison table and trailing gap of a section"""
+        return [
+            cached_paragraph(title, self.styles['SectionHeader']),
+            self.create_comparison_table(properties),
+            Spacer(1, 0.3*cm),
+        ]
+
+    def create_title(self):
+        """Create the main title flowables"""
+        return [
+            cached_paragraph("CSS Flexbox vs Tailwind CSS", self.styles['MainTitle']),
+            cached_paragraph("Face-to-Face Comparison Cheat Sheet", self.styles['Subtitle']),
+            Spacer(1, 0.5*cm),
+        ]
 
-        self.story.append(tips_table)
+    def create_container_properties(self):
+        """Create the flex container properties section"""
+        return self.create_section("Flex Container Properties", CONTAINER_PROPERTIES)
+
+    def create_item_properties(self):
+        """Create the flex item properties section"""
+        return self.create_section("Flex Item Properties", ITEM_PROPERTIES)
+
+    def create_examples_section(self):
+        """Create the practical examples box"""
+        # One small Paragraph per line instead of a single <br/>-separated
+        # block, so the parser never sees the whole box at once
+        css_line = "CSS: <font color='%s'>%%s</font>%%s" % self._css_hex
+        tw_line = "Tailwind: <font color='%s'>%%s</font>%%s" % self._tw_hex
+        normal_style = self.styles['Normal']
+        label_style = self.styles['BoxLabel']
+        flowables = [cached_paragraph("<b>Common Patterns:</b>", normal_style)]
+        for label, css, tailwind, note in EXAMPLES:
+            flowables.extend((
+                cached_paragraph(f"<b>{label}:</b>", label_style),
+                cached_paragraph(css_line % (css, note), normal_style),
+                cached_paragraph(tw_line % (tailwind, note), normal_style),
+            ))
+
+        # Create a colored background table for examples
+        examples_table = Table([[flowables]], colWidths=BOX_WIDTHS)
+        examples_table.setStyle(self.examples_table_style)
+
+        return [examples_table, Spacer(1, 0.3*cm)]
+
+    def create_tips_section(self):
+        """Create the tips and best practices box"""
+        # One small Paragraph per line, as in the examples box
+        normal_style = self.styles['Normal']
+        label_style = self.styles['BoxLabel']
+        flowables = [cached_paragraph("<b>Tips & Best Practices:</b>", normal_style)]
+        for heading, bullets in TIPS:
+            flowables.append(cached_paragraph(f"<b>{heading}:</b>", label_style))
+            flowables.extend(cached_paragraph(f"• {bullet}", normal_style) for bullet in bullets)
+
+        # Create a colored background table for tips
+        tips_table = Table([[flowables]], colWidths=BOX_WIDTHS)
+        tips_table.setStyle(self.tips_table_style)
+
+        return [tips_table]
 
     def generate_pdf(self):
         """Generate the complete PDF"""
-        # Single page
-        self.add_title()
-        self.add_container_properties()
-        self.add_item_properties()
-        self.add_examples_section()
-        self.add_tips_section()
+        # The output is a pure function of the data, styles and reportlab
+        # version, so skip the build when the PDF on disk came from the same
+        # source; the key lives in a sidecar file next to it
+        key = content_key(__file__)
+        if pdf_is_current(self.filename, key):
+            print(f"✅ Flexbox Cheat Sheet PDF is up to date: {self.filename}")
+            return self.filename
+
+        # Assemble the whole story in one pass from the per-part flowables
+        self.story = list(chain(
+            self.create_title(),
+            self.create_container_properties(),
+            self.create_item_properties(),
+            self.create_examples_section(),
+            self.create_tips_section(),
+        ))
 
         # Build PDF
         self.doc.build(self.story)
+        write_pdf(self.filename, self._buffer.getvalue(), key)
         print(f"✅ Flexbox Cheat Sheet PDF generated successfully: {self.filename}")
         return self.filename
 
+# Module-level (and therefore picklable) entry point, so a batch driver can
+# build several cheat sheets in parallel with a ProcessPoolExecutor; the
+# shared styles and parsed fragments are per-process caches, so workers
+# never share generator state
+def build_pdf(filename="flexbox_cheat_sheet.pdf"):
+    """Build the cheat sheet PDF and return its filename"""
+    return FlexboxCheatSheetPDF(filename).generate_pdf()
+
 def main():
     """Main function to generate the PDF"""
     try:
@@ -305,17 +413,24 @@ def main():
         filename = pdf_generator.generate_pdf()
 
         print(f"\n🎨 Flexbox Cheat Sheet PDF created: {filename}")
-        print(f"📄 File size: {os.path.getsize(filename)} bytes")
-        print(f"📅 Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # One stat call gives both the size and the write time
+        file_stat = os.stat(filename)
+        print(f"📄 File size: {file_stat.st_size} bytes")
+        print(f"📅 Created: {datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
 
-        # Try to open the PDF (platform-specific)
+        # Try to open the PDF (platform-specific), without going through a
+        # shell or waiting for the viewer
         import platform
-        if platform.system() == "Darwin":  # macOS
-            os.system(f"open {filename}")
-        elif platform.system() == "Windows":
-            os.system(f"start {filename}")
-        else:  # Linux
-            os.system(f"xdg-open {filename}")
+        import subprocess
+        try:
+            if platform.system() == "Windows":
+                os.startfile(filename)
+            else:
+                opener = "open" if platform.system() == "Darwin" else "xdg-open"
+                subprocess.Popen([opener, filename], start_new_session=True,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            print("⚠️ Could not open the PDF automatically")
 
     except ImportError as e:
         print("❌ Required library not found!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Batch Cheat Sheet PDF Generator
+Builds every cheat sheet in the repository in parallel, one process per sheet
+"""
+
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Generator modules; each exposes build_pdf() writing its default PDF
+GENERATORS = (
+    "basic_css_tailwind_cheat_sheet_generator",
+    "docker_cheat_sheet_generator",
+    "flexbox_cheat_sheet_generator",
+    "git_cheat_sheet_generator",
+    "grid_cheat_sheet_generator",
+    "laravel_cheat_sheet_generator",
+)
+
+def _build_one(module_name):
+    """Import a generator module in the worker and build its PDF"""
+    return importlib.import_module(module_name).build_pdf()
+
+def main():
+    """Build all cheat sheets concurrently"""
+    try:
+        # ReportLab layout is pure Python and every sheet is independent,
+        # so separate processes sidestep the GIL
+        with ProcessPoolExecutor(max_workers=min(len(GENERATORS), os.cpu_count() or 1)) as executor:
+            filenames = list(executor.map(_build_one, GENERATORS))
+
+        print(f"\n[SUCCESS] Generated {len(filenames)} cheat sheets:")
+        for filename in filenames:
+            print(f"   {filename} ({os.path.getsize(filename)} bytes)")
+
+    except ImportError as e:
+        print("[ERROR] Required library not found!")
+        print("[INFO] Install required packages with:")
+        print("   pip install reportlab")
+        print(f"\nError details: {e}")
+    except Exception as e:
+        print(f"[ERROR] Error generating PDFs: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,192 @@ Git Commands Cheat Sheet PDF Generator
 Creates a colorful, well-formatted 2-page A4 PDF Git command reference
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.platypus.frames import Frame
-from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+# reportlab is imported lazily inside the functions that need it, so importing
+# this module (e.g. from a batch driver) stays cheap and a missing install is
+# reported by main() instead of failing at import time
+import io
 import os
-from datetime import datetime
+import re
+from functools import lru_cache
+from cheat_sheet_common import cached_paragraph, content_key, pdf_is_current, write_pdf
+
+# Basic Git operations
+BASIC_COMMANDS = (
+    ("git init", "Initialize a new Git repository"),
+    ("git clone <url>", "Clone remote repository to local machine"),
+    ("git clone <url> <directory>", "Clone into specific directory"),
+    ("git status", "Show working tree status"),
+    ("git add <file>", "Add file to staging area"),
+    ("git add .", "Add all files to staging area"),
+    ("git add -A", "Add all files (including deleted)"),
+    ("git commit -m '<message>'", "Commit staged changes with message"),
+    ("git commit -am '<message>'", "Add all tracked files and commit"),
+    ("git commit --amend", "Modify last commit"),
+    ("git log", "Show commit history"),
+    ("git log --oneline", "Show condensed commit history"),
+    ("git log --graph", "Show commit history as graph"),
+)
+
+# Branching and merging commands
+BRANCHING_COMMANDS = (
+    ("git branch", "List local branches"),
+    ("git branch -a", "List all branches (local + remote)"),
+    ("git branch <branch-name>", "Create new branch"),
+    ("git branch -d <branch-name>", "Delete merged branch"),
+    ("git branch -D <branch-name>", "Force delete branch"),
+    ("git checkout <branch-name>", "Switch to branch"),
+    ("git checkout -b <branch-name>", "Create and switch to new branch"),
+    ("git switch <branch-name>", "Switch to branch (Git 2.23+)"),
+    ("git switch -c <branch-name>", "Create and switch to new branch"),
+    ("git merge <branch-name>", "Merge branch into current branch"),
+    ("git merge --no-ff <branch-name>", "Merge with merge commit"),
+    ("git rebase <branch-name>", "Rebase current branch onto branch"),
+)
+
+# Substrings marking the dangerous commands above
+BRANCHING_DANGEROUS = ('reset --hard', 'push --force', 'rebase')
+
+# Remote repository commands
+REMOTE_COMMANDS = (
+    ("git remote", "List remote repositories"),
+    ("git remote -v", "List remotes with URLs"),
+    ("git remote add <name> <url>", "Add remote repository"),
+    ("git remote remove <name>", "Remove remote repository"),
+    ("git fetch", "Download changes from remote"),
+    ("git fetch <remote>", "Fetch from specific remote"),
+    ("git pull", "Fetch and merge from remote"),
+    ("git pull --rebase", "Fetch and rebase instead of merge"),
+    ("git push", "Push changes to remote"),
+    ("git push <remote> <branch-name>", "Push branch to specific remote"),
+    ("git push -u origin <branch-name>", "Push and set upstream branch"),
+    ("git push --force", "Force push (dangerous)"),
+    ("git push --force-with-lease", "Safer force push"),
+)
+
+# Substrings marking the dangerous commands above
+REMOTE_DANGEROUS = ('push --force',)
+
+# Inspection and comparison commands
+INSPECTION_COMMANDS = (
+    ("git diff", "Show unstaged changes"),
+    ("git diff --staged", "Show staged changes"),
+    ("git diff <branch-name>", "Compare with another branch"),
+    ("git diff HEAD~1", "Compare with previous commit"),
+    ("git show <commit-id>", "Show specific commit details"),
+    ("git blame <file>", "Show who changed each line"),
+    ("git log --follow <file>", "Show file history across renames"),
+    ("git log --grep='<pattern>'", "Search commits by message"),
+    ("git log --author='<name>'", "Filter commits by author"),
+    ("git reflog", "Show reference log (recovery tool)"),
+)
+
+# Commands for undoing changes
+UNDOING_COMMANDS = (
+    ("git checkout -- <file>", "Discard changes in working directory"),
+    ("git restore <file>", "Discard changes (Git 2.23+)"),
+    ("git reset <file>", "Unstage file (keep changes in working directory)"),
+    ("git reset --soft HEAD~1", "Resets to one commit before HEAD (the immediate previous commit). HEAD~1 means 'parent of HEAD'"),
+    ("git reset --soft <commit-id>", "Resets to a specific commit hash you provide. You can reset to any commit in history"),
+    ("git reset --mixed HEAD~1", "Resets to one commit before HEAD, unstaging changes but keeping them in working directory"),
+    ("git reset --mixed <commit-id>", "Resets to a specific commit hash, unstaging changes but keeping them in working directory"),
+    ("git reset --hard HEAD~1", "Resets to one commit before HEAD and permanently deletes all uncommitted changes"),
+    ("git reset --hard <commit-id>", "Resets to a specific commit hash and permanently deletes all uncommitted changes"),
+    ("git revert <commit-id>", "Create commit that undoes specified commit"),
+    ("git clean -n", "Preview untracked files to delete"),
+    ("git clean -f", "Delete untracked files"),
+    ("git clean -fd", "Delete untracked files and directories"),
+)
+
+# Substrings marking the dangerous commands above
+UNDOING_DANGEROUS = ('reset --hard', 'clean -fd')
+
+# Stashing commands
+STASHING_COMMANDS = (
+    ("git stash", "Stash current changes"),
+    ("git stash save '<message>'", "Stash with message"),
+    ("git stash list", "List all stashes"),
+    ("git stash show", "Show latest stash changes"),
+    ("git stash show -p", "Show latest stash as patch"),
+    ("git stash apply", "Apply latest stash"),
+    ("git stash apply stash@{<index>}", "Apply specific stash"),
+    ("git stash pop", "Apply and remove latest stash"),
+    ("git stash drop", "Delete latest stash"),
+    ("git stash clear", "Delete all stashes"),
+)
+
+# Advanced Git commands
+ADVANCED_COMMANDS = (
+    ("git tag", "List tags"),
+    ("git tag <tag-name>", "Create lightweight tag"),
+    ("git tag -a <tag-name> -m '<message>'", "Create annotated tag"),
+    ("git tag -d <tag-name>", "Delete tag"),
+    ("git cherry-pick <commit-id>", "Apply specific commit to current branch"),
+    ("git bisect start", "Start binary search for bug"),
+    ("git submodule add <url>", "Add Git submodule"),
+    ("git submodule update --init", "Initialize and update submodules"),
+    ("git archive --format=zip HEAD", "Create archive of current HEAD"),
+    ("git gc", "Cleanup unnecessary files"),
+    ("git fsck", "Check repository integrity"),
+)
+
+# Substrings marking the dangerous commands above
+ADVANCED_DANGEROUS = ('filter-branch', 'gc --aggressive')
+
+# Git configuration commands
+CONFIGURATION_COMMANDS = (
+    ("git config --global user.name '<name>'", "Set global username"),
+    ("git config --global user.email '<email>'", "Set global email"),
+    ("git config --list", "Show all configuration"),
+    ("git config user.name", "Show username"),
+    ("git config --global init.defaultBranch main", "Set default branch name"),
+    ("git config --global core.editor <editor>", "Set default editor"),
+    ("git config --global alias.<alias> <command>", "Create alias for command"),
+    ("git config --global core.autocrlf true", "Auto convert line endings (Windows)"),
+    ("git config --global core.autocrlf input", "Auto convert line endings (Mac/Linux)"),
+    ("git config --global pull.rebase false", "Default merge behavior for pull"),
+)
+
+# Same value as reportlab.lib.units.cm, spelled out so the column widths below
+# can be computed at import time without loading reportlab
+CM = 72.0 / 2.54
+
+# Command table column widths in points: (command, description)
+DEFAULT_WIDTHS = (7*CM, 8*CM)
+WIDE_WIDTHS = (6*CM, 9*CM)
+CONFIG_WIDTHS = (8*CM, 7*CM)
+
+# Characters that must be escaped before raw command text goes into markup
+MARKUP_ESCAPES = str.maketrans({'<': '&lt;', '>': '&gt;', '&': '&amp;'})
+
+@lru_cache(maxsize=None)
+def danger_pattern(dangerous_commands):
+    """Compile one alternation matching any of the given dangerous commands"""
+    return re.compile('|'.join(map(re.escape, dangerous_commands)))
 
 class GitCheatSheetPDF:
+    # Sample stylesheet plus the custom styles, shared by every instance in
+    # the process; the styles only depend on the fixed color scheme
+    _shared_styles = None
+
     def __init__(self, filename="git_cheat_sheet.pdf"):
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import cm
+        from reportlab.lib.colors import HexColor
+        from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
+
         self.filename = filename
-        self.doc = SimpleDocTemplate(filename, pagesize=A4, 
+        # The document is rendered into memory and written to disk in one go
+        self._buffer = io.BytesIO()
+        self.doc = BaseDocTemplate(self._buffer, pagesize=A4,
                                    rightMargin=1*cm, leftMargin=1*cm,
-                                   topMargin=1.5*cm, bottomMargin=1*cm)
-        self.styles = getSampleStyleSheet()
+                                   topMargin=1.5*cm, bottomMargin=1*cm,
+                                   pageCompression=1, invariant=1)
+        # One explicit full-page frame shared by every page; the sheet needs
+        # none of SimpleDocTemplate's first/later page callback plumbing
+        content_frame = Frame(self.doc.leftMargin, self.doc.bottomMargin,
+                              self.doc.width, self.doc.height, id='content')
+        self.doc.addPageTemplates([PageTemplate(id='page', frames=[content_frame])])
         self.story = []
         
         # Define color scheme
@@ -32,14 +200,30 @@ class GitCheatSheetPDF:
             'description': HexColor('#2C3E50'), # Dark gray
             'background': HexColor('#F8F9FA'),  # Light gray
             'accent': HexColor('#6C5CE7'),      # Purple
-            'warning': HexColor('#E74C3C')      # Red for dangerous commands
+            'warning': HexColor('#E74C3C'),     # Red for dangerous commands
+            'workflows_bg': HexColor('#E8F4FD'), # Light blue for workflows box
+            'tips_bg': HexColor('#F0F8E8'),     # Light green for tips box
         }
+
+        # Command cell markup with the colour formatted in once, leaving a
+        # single %s for the command text
+        self._command_markup = "<font name='Courier-Bold' color='%s'>%%s</font>" % self.colors['command'].hexval()
+        self._warning_markup = "<font name='Courier-Bold' color='%s'>%%s</font>" % self.colors['warning'].hexval()
         
-        # Custom styles
-        self.create_custom_styles()
+        # Custom styles, built by the first instance only
+        if GitCheatSheetPDF._shared_styles is None:
+            self.styles = getSampleStyleSheet()
+            self.create_custom_styles()
+            GitCheatSheetPDF._shared_styles = self.styles
+        self.styles = GitCheatSheetPDF._shared_styles
+        self.create_table_styles()
     
     def create_custom_styles(self):
         """Create custom paragraph styles"""
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.units import cm
+        from reportlab.lib.enums import TA_CENTER
+
         # Main title style
         self.styles.add(ParagraphStyle(
             name='MainTitle',
@@ -62,41 +246,93 @@ class GitCheatSheetPDF:
             fontName='Helvetica-Bold'
         ))
 
-    def create_command_table(self, title, commands, col_widths=[7*cm, 8*cm], dangerous_commands=None):
-        """Create a formatted table for commands"""
-        if dangerous_commands is None:
-            dangerous_commands = []
-            
-        # Add section header
-        self.story.append(Paragraph(title, self.styles['SectionHeader']))
-        
-        # Prepare table data
-        data = []
-        for cmd, desc in commands:
-            # Use warning color for dangerous commands
-            color = '#E74C3C' if any(danger in cmd for danger in dangerous_commands) else '#FF6B35'
-            data.append([
-                Paragraph(f"<font name='Courier-Bold' color='{color}'>{cmd}</font>", self.styles['Normal']),
-                Paragraph(desc, self.styles['Normal'])
-            ])
-        
-        # Create table
-        table = Table(data, colWidths=col_widths, repeatRows=0)
-        table.setStyle(TableStyle([
+        # Highlight box styles: the paragraph draws its own background and
+        # border, inset to a 17cm box centred in the frame
+        box_indent = 1*cm + 12
+        self.styles.add(ParagraphStyle(
+            name='WorkflowsBox',
+            parent=self.styles['Normal'],
+            leftIndent=box_indent,
+            rightIndent=box_indent,
+            spaceBefore=10,
+            spaceAfter=10,
+            backColor=self.colors['workflows_bg'],
+            borderColor=self.colors['section'],
+            borderWidth=1,
+            borderPadding=(10, 12)
+        ))
+
+        self.styles.add(ParagraphStyle(
+            name='TipsBox',
+            parent=self.styles['WorkflowsBox'],
+            backColor=self.colors['tips_bg']
+        ))
+
+    def create_table_styles(self):
+        """Create the table style shared by every command table"""
+        from reportlab.lib.colors import black, white
+        from reportlab.platypus import TableStyle
+
+        # Command table style; all spans are relative so one instance
+        # serves every section regardless of row count or column widths
+        self.table_style = TableStyle([
             ('BACKGROUND', (0, 0), (-1, -1), self.colors['background']),
             ('TEXTCOLOR', (0, 0), (-1, -1), black),
+            ('TEXTCOLOR', (0, 0), (0, -1), self.colors['command']),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
             ('FONTNAME', (0, 0), (0, -1), 'Courier-Bold'),
             ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('LEADING', (0, 0), (-1, -1), 12),
             ('GRID', (0, 0), (-1, -1), 0.5, self.colors['section']),
             ('ROWBACKGROUNDS', (0, 0), (-1, -1), [white, self.colors['background']]),
             ('LEFTPADDING', (0, 0), (-1, -1), 8),
             ('RIGHTPADDING', (0, 0), (-1, -1), 8),
             ('TOPPADDING', (0, 0), (-1, -1), 6),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        ])
+
+    def create_command_table(self, title, commands, col_widths=DEFAULT_WIDTHS, dangerous_commands=()):
+        """Create a formatted table for commands"""
+        from reportlab.lib.units import cm
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from reportlab.platypus import Table, Paragraph, Spacer
+
+        # Add section header
+        self.story.append(Paragraph(title, self.styles['SectionHeader']))
+        
+        # Prepare table data; dangerous commands are found with one
+        # precompiled alternation per row instead of a substring scan each.
+        # Cells are plain strings styled by the shared TableStyle column
+        # spans; only text too wide for its column (or a description carrying
+        # markup characters) falls back to a wrapping Paragraph
+        is_dangerous = danger_pattern(dangerous_commands).search if dangerous_commands else None
+        command_markup = self._command_markup
+        warning_markup = self._warning_markup
+        normal_style = self.styles['Normal']
+        cmd_width = col_widths[0] - 16
+        desc_width = col_widths[1] - 16
+        data = []
+        warning_rows = []
+        for row, (cmd, desc) in enumerate(commands):
+            # Use warning color for dangerous commands
+            dangerous = is_dangerous is not None and is_dangerous(cmd)
+            if dangerous:
+                warning_rows.append(row)
+            if stringWidth(cmd, 'Courier-Bold', 10) > cmd_width:
+                markup = warning_markup if dangerous else command_markup
+                cmd = cached_paragraph(markup % cmd.translate(MARKUP_ESCAPES), normal_style)
+            if '<' in desc or '&' in desc or stringWidth(desc, 'Helvetica', 10) > desc_width:
+                desc = cached_paragraph(desc, normal_style)
+            data.append([cmd, desc])
+        
+        # Create table; warning rows recolour just their command cell
+        table = Table(data, colWidths=col_widths, repeatRows=0)
+        table.setStyle(self.table_style)
+        if warning_rows:
+            warning = self.colors['warning']
+            table.setStyle([('TEXTCOLOR', (0, row), (0, row), warning) for row in warning_rows])
         
         self.story.append(table)
         self.story.append(Spacer(1, 0.3*cm))
@@ -104,158 +340,52 @@ class GitCheatSheetPDF:
 
     def add_title(self):
         """Add the main title"""
-        title = Paragraph("🌿 Git Commands Cheat Sheet 🌿", self.styles['MainTitle'])
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Paragraph, Spacer
+
+        title = Paragraph("Git Commands Cheat Sheet", self.styles['MainTitle'])
         self.story.append(title)
         self.story.append(Spacer(1, 0.5*cm))
 
     def add_basic_commands(self):
         """Add basic Git commands"""
-        commands = [
-            ("git init", "Initialize a new Git repository"),
-            ("git clone &lt;url&gt;", "Clone remote repository to local machine"),
-            ("git clone &lt;url&gt; &lt;directory&gt;", "Clone into specific directory"),
-            ("git status", "Show working tree status"),
-            ("git add &lt;file&gt;", "Add file to staging area"),
-            ("git add .", "Add all files to staging area"),
-            ("git add -A", "Add all files (including deleted)"),
-            ("git commit -m '&lt;message&gt;'", "Commit staged changes with message"),
-            ("git commit -am '&lt;message&gt;'", "Add all tracked files and commit"),
-            ("git commit --amend", "Modify last commit"),
-            ("git log", "Show commit history"),
-            ("git log --oneline", "Show condensed commit history"),
-            ("git log --graph", "Show commit history as graph"),
-        ]
-        self.create_command_table("Basic Git Operations", commands)
+        self.create_command_table("Basic Git Operations", BASIC_COMMANDS)
 
     def add_branching_commands(self):
         """Add branching and merging commands"""
-        dangerous_commands = ['reset --hard', 'push --force', 'rebase']
-        commands = [
-            ("git branch", "List local branches"),
-            ("git branch -a", "List all branches (local + remote)"),
-            ("git branch &lt;branch-name&gt;", "Create new branch"),
-            ("git branch -d &lt;branch-name&gt;", "Delete merged branch"),
-            ("git branch -D &lt;branch-name&gt;", "Force delete branch"),
-            ("git checkout &lt;branch-name&gt;", "Switch to branch"),
-            ("git checkout -b &lt;branch-name&gt;", "Create and switch to new branch"),
-            ("git switch &lt;branch-name&gt;", "Switch to branch (Git 2.23+)"),
-            ("git switch -c &lt;branch-name&gt;", "Create and switch to new branch"),
-            ("git merge &lt;branch-name&gt;", "Merge branch into current branch"),
-            ("git merge --no-ff &lt;branch-name&gt;", "Merge with merge commit"),
-            ("git rebase &lt;branch-name&gt;", "⚠️ Rebase current branch onto branch"),
-        ]
-        self.create_command_table("Branching & Merging", commands, dangerous_commands=dangerous_commands)
+        self.create_command_table("Branching & Merging", BRANCHING_COMMANDS, dangerous_commands=BRANCHING_DANGEROUS)
 
     def add_remote_commands(self):
         """Add remote repository commands"""
-        dangerous_commands = ['push --force']
-        commands = [
-            ("git remote", "List remote repositories"),
-            ("git remote -v", "List remotes with URLs"),
-            ("git remote add &lt;name&gt; &lt;url&gt;", "Add remote repository"),
-            ("git remote remove &lt;name&gt;", "Remove remote repository"),
-            ("git fetch", "Download changes from remote"),
-            ("git fetch &lt;remote&gt;", "Fetch from specific remote"),
-            ("git pull", "Fetch and merge from remote"),
-            ("git pull --rebase", "Fetch and rebase instead of merge"),
-            ("git push", "Push changes to remote"),
-            ("git push &lt;remote&gt; &lt;branch-name&gt;", "Push branch to specific remote"),
-            ("git push -u origin &lt;branch-name&gt;", "Push and set upstream branch"),
-            ("git push --force", "⚠️ Force push (dangerous)"),
-            ("git push --force-with-lease", "Safer force push"),
-        ]
-        self.create_command_table("Remote Repository Operations", commands, dangerous_commands=dangerous_commands)
+        self.create_command_table("Remote Repository Operations", REMOTE_COMMANDS, dangerous_commands=REMOTE_DANGEROUS)
 
     def add_inspection_commands(self):
         """Add inspection and comparison commands"""
-        commands = [
-            ("git diff", "Show unstaged changes"),
-            ("git diff --staged", "Show staged changes"),
-            ("git diff &lt;branch-name&gt;", "Compare with another branch"),
-            ("git diff HEAD~1", "Compare with previous commit"),
-            ("git show &lt;commit-id&gt;", "Show specific commit details"),
-            ("git blame &lt;file&gt;", "Show who changed each line"),
-            ("git log --follow &lt;file&gt;", "Show file history across renames"),
-            ("git log --grep='&lt;pattern&gt;'", "Search commits by message"),
-            ("git log --author='&lt;name&gt;'", "Filter commits by author"),
-            ("git reflog", "Show reference log (recovery tool)"),
-        ]
-        self.create_command_table("Inspection & Comparison", commands)
+        self.create_command_table("Inspection & Comparison", INSPECTION_COMMANDS)
 
     def add_undoing_commands(self):
         """Add commands for undoing changes"""
-        dangerous_commands = ['reset --hard', 'clean -fd']
-        commands = [
-            ("git checkout -- &lt;file&gt;", "Discard changes in working directory"),
-            ("git restore &lt;file&gt;", "Discard changes (Git 2.23+)"),
-            ("git reset &lt;file&gt;", "Unstage file (keep changes in working directory)"),
-            ("git reset --soft HEAD~1", "Resets to one commit before HEAD (the immediate previous commit). HEAD~1 means 'parent of HEAD'"),
-            ("git reset --soft &lt;commit-id&gt;", "Resets to a specific commit hash you provide. You can reset to any commit in history"),
-            ("git reset --mixed HEAD~1", "Resets to one commit before HEAD, unstaging changes but keeping them in working directory"),
-            ("git reset --mixed &lt;commit-id&gt;", "Resets to a specific commit hash, unstaging changes but keeping them in working directory"),
-            ("git reset --hard HEAD~1", "⚠️ Resets to one commit before HEAD and permanently deletes all uncommitted changes"),
-            ("git reset --hard &lt;commit-id&gt;", "⚠️ Resets to a specific commit hash and permanently deletes all uncommitted changes"),
-            ("git revert &lt;commit-id&gt;", "Create commit that undoes specified commit"),
-            ("git clean -n", "Preview untracked files to delete"),
-            ("git clean -f", "Delete untracked files"),
-            ("git clean -fd", "⚠️ Delete untracked files and directories"),
-        ]
-        self.create_command_table("Undoing Changes", commands, dangerous_commands=dangerous_commands)
+        self.create_command_table("Undoing Changes", UNDOING_COMMANDS, dangerous_commands=UNDOING_DANGEROUS)
 
     def add_stashing_commands(self):
         """Add stashing commands"""
-        commands = [
-            ("git stash", "Stash current changes"),
-            ("git stash save '&lt;message&gt;'", "Stash with message"),
-            ("git stash list", "List all stashes"),
-            ("git stash show", "Show latest stash changes"),
-            ("git stash show -p", "Show latest stash as patch"),
-            ("git stash apply", "Apply latest stash"),
-            ("git stash apply stash@{&lt;index&gt;}", "Apply specific stash"),
-            ("git stash pop", "Apply and remove latest stash"),
-            ("git stash drop", "Delete latest stash"),
-            ("git stash clear", "Delete all stashes"),
-        ]
-        self.create_command_table("Stashing", commands, [6*cm, 9*cm])
+        self.create_command_table("Stashing", STASHING_COMMANDS, WIDE_WIDTHS)
 
     def add_advanced_commands(self):
         """Add advanced Git commands"""
-        dangerous_commands = ['filter-branch', 'gc --aggressive']
-        commands = [
-            ("git tag", "List tags"),
-            ("git tag &lt;tag-name&gt;", "Create lightweight tag"),
-            ("git tag -a &lt;tag-name&gt; -m '&lt;message&gt;'", "Create annotated tag"),
-            ("git tag -d &lt;tag-name&gt;", "Delete tag"),
-            ("git cherry-pick &lt;commit-id&gt;", "Apply specific commit to current branch"),
-            ("git bisect start", "Start binary search for bug"),
-            ("git submodule add &lt;url&gt;", "Add Git submodule"),
-            ("git submodule update --init", "Initialize and update submodules"),
-            ("git archive --format=zip HEAD", "Create archive of current HEAD"),
-            ("git gc", "Cleanup unnecessary files"),
-            ("git fsck", "Check repository integrity"),
-        ]
-        self.create_command_table("Advanced Commands", commands, [6*cm, 9*cm], dangerous_commands)
+        self.create_command_table("Advanced Commands", ADVANCED_COMMANDS, WIDE_WIDTHS, ADVANCED_DANGEROUS)
 
     def add_configuration_commands(self):
         """Add Git configuration commands"""
-        commands = [
-            ("git config --global user.name '&lt;name&gt;'", "Set global username"),
-            ("git config --global user.email '&lt;email&gt;'", "Set global email"),
-            ("git config --list", "Show all configuration"),
-            ("git config user.name", "Show username"),
-            ("git config --global init.defaultBranch main", "Set default branch name"),
-            ("git config --global core.editor &lt;editor&gt;", "Set default editor"),
-            ("git config --global alias.&lt;alias&gt; &lt;command&gt;", "Create alias for command"),
-            ("git config --global core.autocrlf true", "Auto convert line endings (Windows)"),
-            ("git config --global core.autocrlf input", "Auto convert line endings (Mac/Linux)"),
-            ("git config --global pull.rebase false", "Default merge behavior for pull"),
-        ]
-        self.create_command_table("Configuration", commands, [8*cm, 7*cm])
+        self.create_command_table("Configuration", CONFIGURATION_COMMANDS, CONFIG_WIDTHS)
 
     def add_workflows_section(self):
         """Add common Git workflows"""
+        from reportlab.lib.units import cm
+        from reportlab.platypus import KeepTogether, Spacer
+
         workflows_text = """
-        <b>🔄 Common Git Workflows:</b><br/>
+        <b>Common Git Workflows:</b><br/>
         <br/>
         <b>Feature Branch Workflow:</b><br/>
         1. git checkout -b feature/&lt;feature-name&gt;<br/>
@@ -280,31 +410,17 @@ class GitCheatSheetPDF:
         5. git checkout develop && git merge release/&lt;version&gt;
         """
         
-        workflows_para = Paragraph(workflows_text, self.styles['Normal'])
-        
-        # Create a colored background table for workflows
-        workflows_table = Table([[workflows_para]], colWidths=[17*cm])
-        workflows_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#E8F4FD')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), HexColor('#1B4F72')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#2E8B57')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        
-        self.story.append(workflows_table)
+        # Single boxed paragraph; no wrapping table needed for the background.
+        # KeepTogether moves the box to the next page instead of cutting it
+        self.story.append(KeepTogether([cached_paragraph(workflows_text, self.styles['WorkflowsBox'])]))
         self.story.append(Spacer(1, 0.3*cm))
 
     def add_tips_section(self):
         """Add tips and best practices"""
+        from reportlab.platypus import KeepTogether
+
         tips_text = """
-        <b>💡 Git Tips & Best Practices:</b><br/>
+        <b>Git Tips & Best Practices:</b><br/>
         <br/>
         • Write clear, descriptive commit messages<br/>
         • Commit early and often with logical chunks<br/>
@@ -319,35 +435,28 @@ class GitCheatSheetPDF:
         • Use git reflog as a safety net for recovery<br/>
         • Set up GPG signing for verified commits<br/>
         <br/>
-        <b>⚠️ Dangerous Commands (use with caution):</b><br/>
+        <b>Dangerous Commands (use with caution):</b><br/>
         • git reset --hard: Permanently loses uncommitted changes<br/>
         • git push --force: Can overwrite others' work<br/>
         • git rebase: Changes commit history (don't rebase shared branches)<br/>
         • git clean -fd: Permanently deletes untracked files
         """
         
-        tips_para = Paragraph(tips_text, self.styles['Normal'])
-        
-        # Create a colored background table for tips
-        tips_table = Table([[tips_para]], colWidths=[17*cm])
-        tips_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor('#F0F8E8')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), HexColor('#1B4F72')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#2E8B57')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        
-        self.story.append(tips_table)
+        # Single boxed paragraph, kept whole like the workflows box
+        self.story.append(KeepTogether([cached_paragraph(tips_text, self.styles['TipsBox'])]))
 
     def generate_pdf(self):
         """Generate the complete PDF"""
+        from reportlab.platypus import PageBreak
+
+        # The output is a pure function of the data, styles and reportlab
+        # version, so skip the build when the PDF on disk came from the same
+        # source; the key lives in a sidecar file next to it
+        key = content_key(__file__)
+        if pdf_is_current(self.filename, key):
+            print(f"✅ Git Cheat Sheet PDF is up to date: {self.filename}")
+            return self.filename
+
         # Page 1
         self.add_title()
         self.add_basic_commands()
@@ -368,11 +477,27 @@ class GitCheatSheetPDF:
         
         # Build PDF
         self.doc.build(self.story)
+        write_pdf(self.filename, self._buffer.getvalue(), key)
         print(f"✅ Git Cheat Sheet PDF generated successfully: {self.filename}")
         return self.filename
 
+def build_pdf(filename="git_cheat_sheet.pdf"):
+    """Build the cheat sheet PDF and return its filename"""
+    return GitCheatSheetPDF(filename).generate_pdf()
+
 def main():
     """Main function to generate the PDF"""
+    from datetime import datetime
+    from importlib.util import find_spec
+
+    # Check for reportlab up front, so an ImportError raised for any other
+    # reason is reported as the real error instead of as a missing install
+    if find_spec("reportlab") is None:
+        print("❌ Required library not found!")
+        print("📦 Install required packages with:")
+        print("   pip install reportlab")
+        return
+
     try:
         # Create PDF generator
         pdf_generator = GitCheatSheetPDF("git_cheat_sheet.pdf")
@@ -381,23 +506,26 @@ def main():
         filename = pdf_generator.generate_pdf()
         
         print(f"\n🌿 Git Cheat Sheet PDF created: {filename}")
-        print(f"📄 File size: {os.path.getsize(filename)} bytes")
-        print(f"📅 Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # One stat call gives both the size and the write time, which also
+        # stays correct when an up-to-date PDF was reused
+        file_stat = os.stat(filename)
+        print(f"📄 File size: {file_stat.st_size} bytes")
+        print(f"📅 Created: {datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # Try to open the PDF (platform-specific)
+        # Try to open the PDF (platform-specific), without going through a
+        # shell or waiting for the viewer
         import platform
-        if platform.system() == "Darwin":  # macOS
-            os.system(f"open {filename}")
-        elif platform.system() == "Windows":
-            os.system(f"start {filename}")
-        else:  # Linux
-            os.system(f"xdg-open {filename}")
+        import subprocess
+        try:
+            if platform.system() == "Windows":
+                os.startfile(filename)
+            else:
+                opener = "open" if platform.system() == "Darwin" else "xdg-open"
+                subprocess.Popen([opener, filename], start_new_session=True,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            print("⚠️ Could not open the PDF automatically")
             
-    except ImportError as e:
-        print("❌ Required library not found!")
-        print("📦 Install required packages with:")
-        print("   pip install reportlab")
-        print(f"\nError details: {e}")
     except Exception as e:
         print(f"❌ Error generating PDF: {e}")
 